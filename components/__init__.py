@@ -1,2 +1,4 @@
 from .number_converter import NumberConverter
-from .cpp_reference import CppReference
\ No newline at end of file
+from .cpp_reference import CppReference
+from .file_checksum import FileChecksum
+from .binary_diff import BinaryDiff
\ No newline at end of file
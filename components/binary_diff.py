@@ -0,0 +1,383 @@
+import tkinter as tk
+from tkinter import ttk, filedialog, messagebox
+import os
+import sys
+import re
+import mmap
+import time
+import queue
+import threading
+from lang import lang
+
+# 粗比较块大小：相同的块直接用 bytes 相等比较（memcmp）跳过
+CHUNK_SIZE = 8 * 1024 * 1024
+# 细比较块大小：不同的大块内部按块跳过相同部分
+BLOCK_SIZE = 4096
+# 递归二分到此长度后直接定位差异字节
+LEAF_SIZE = 512
+# 异或结果中连续的非零字节即一段差异
+NONZERO_RUN = re.compile(rb"[^\x00]+")
+# 差异区间上限，保证内存占用有界
+MAX_RANGES = 100000
+# 十六进制视图每行字节数与可见行数
+BYTES_PER_ROW = 16
+VISIBLE_ROWS = 16
+# 后台结果轮询间隔（毫秒）
+POLL_INTERVAL = 100
+
+
+def open_mapping(f):
+    """以只读方式映射文件，空文件返回空字节串"""
+    if os.fstat(f.fileno()).st_size == 0:
+        return b""
+    return mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+
+
+def diff_span(a, b, base, ranges):
+    """递归比较两段等长且不相同的字节串，把精确的差异区间并入 ranges
+
+    相同的一半直接跳过（memcmp），不同的一半继续二分；
+    到足够小的片段后用异或结果定位每一段连续的不同字节。
+    """
+    if len(a) <= LEAF_SIZE:
+        xor = (int.from_bytes(a, "big") ^ int.from_bytes(b, "big")).to_bytes(len(a), "big")
+        for match in NONZERO_RUN.finditer(xor):
+            add_range(ranges, base + match.start(), base + match.end())
+        return
+
+    mid = len(a) // 2
+    if a[:mid] != b[:mid]:
+        diff_span(a[:mid], b[:mid], base, ranges)
+    if a[mid:] != b[mid:]:
+        diff_span(a[mid:], b[mid:], base + mid, ranges)
+
+
+def add_range(ranges, start, end):
+    """追加差异区间 [start, end)，只在字节真正相邻时与上一个区间合并"""
+    if ranges and ranges[-1][1] == start:
+        ranges[-1] = (ranges[-1][0], end)
+    else:
+        ranges.append((start, end))
+
+
+def diff_files(path_a, path_b, progress=None, cancel=None):
+    """分块比较两个文件，返回 (差异区间列表, 是否截断)"""
+    ranges = []
+    truncated = False
+
+    with open(path_a, "rb") as fa, open(path_b, "rb") as fb:
+        map_a = open_mapping(fa)
+        map_b = open_mapping(fb)
+        try:
+            common = min(len(map_a), len(map_b))
+
+            for offset in range(0, common, CHUNK_SIZE):
+                if cancel and cancel.is_set():
+                    break
+                end = min(offset + CHUNK_SIZE, common)
+                # 切片 mmap 得到 bytes，相等比较走 memcmp；相同的大块整体跳过
+                chunk_a = map_a[offset:end]
+                chunk_b = map_b[offset:end]
+                if chunk_a != chunk_b:
+                    for pos in range(0, end - offset, BLOCK_SIZE):
+                        stop = min(pos + BLOCK_SIZE, end - offset)
+                        block_a = chunk_a[pos:stop]
+                        block_b = chunk_b[pos:stop]
+                        if block_a != block_b:
+                            diff_span(block_a, block_b, offset + pos, ranges)
+                            if len(ranges) > MAX_RANGES:
+                                truncated = True
+                                break
+                if truncated:
+                    break
+                if progress:
+                    progress(end)
+
+            # 长度不同，多出的部分整体视为差异
+            if not truncated and len(map_a) != len(map_b):
+                add_range(ranges, common, max(len(map_a), len(map_b)))
+        finally:
+            if isinstance(map_a, mmap.mmap):
+                map_a.close()
+            if isinstance(map_b, mmap.mmap):
+                map_b.close()
+    return ranges[:MAX_RANGES], truncated
+
+
+class BinaryDiff(tk.Frame):
+
+    def __init__(self, parent, return_callback=None, status_callback=None):
+        super().__init__(parent)
+        self.return_callback = return_callback
+        self.status_callback = status_callback
+        self.pack(fill="both", expand=True)
+
+        self.ranges = []
+        self.current = -1
+        self.top_row = 0
+        self.files = [None, None]
+        self.maps = [b"", b""]
+        self.results = queue.Queue()
+        self.cancel_event = threading.Event()
+        self.poll_id = None
+        self.bind("<Destroy>", self.on_destroy)
+
+        # 返回按钮（先固定在底部，避免被上方内容挤出固定大小的窗口）
+        if self.return_callback:
+            back_btn = ttk.Button(self, text=f"← {lang.get('back')}", command=self.return_callback)
+            back_btn.pack(side=tk.BOTTOM, pady=(5, 10))
+
+        # 文件选择
+        file_frame = ttk.Frame(self)
+        file_frame.pack(pady=(10, 5), padx=20, fill="x")
+        file_frame.columnconfigure(1, weight=1)
+
+        self.path_vars = [tk.StringVar(), tk.StringVar()]
+        for i, key in enumerate(("binary-diff.file-a", "binary-diff.file-b")):
+            ttk.Label(file_frame, text=f"{lang.get(key)}").grid(row=i, column=0, padx=(0, 5), pady=2, sticky="w")
+            ttk.Entry(file_frame, textvariable=self.path_vars[i]).grid(row=i, column=1, padx=5, pady=2, sticky="ew")
+            ttk.Button(
+                file_frame,
+                text="...",
+                width=3,
+                command=lambda idx=i: self.browse(idx)
+            ).grid(row=i, column=2, pady=2)
+
+        # 操作与差异导航
+        action_frame = ttk.Frame(self)
+        action_frame.pack(pady=5, padx=20, fill="x")
+
+        self.compare_btn = ttk.Button(
+            action_frame,
+            text=f"{lang.get('binary-diff.compare')}",
+            command=self.compare,
+        )
+        self.compare_btn.pack(side=tk.LEFT)
+
+        ttk.Button(action_frame, text="▲", width=3, command=self.prev_diff).pack(side=tk.LEFT, padx=(20, 5))
+        ttk.Button(action_frame, text="▼", width=3, command=self.next_diff).pack(side=tk.LEFT)
+
+        self.nav_var = tk.StringVar(value="")
+        ttk.Label(action_frame, textvariable=self.nav_var).pack(side=tk.LEFT, padx=10)
+
+        # 虚拟化十六进制视图：只渲染可见行
+        view_frame = ttk.LabelFrame(self, text=f"{lang.get('binary-diff.hex-view')}")
+        view_frame.pack(pady=5, padx=20, fill="both", expand=True)
+
+        self.hex_text = tk.Text(
+            view_frame,
+            height=VISIBLE_ROWS + 1,
+            font=("Courier", 10),
+            wrap="none",
+            relief="groove",
+        )
+        self.hex_text.tag_configure("header", foreground="gray")
+        self.hex_text.tag_configure("diff", foreground="red", background="#ffe0e0")
+
+        self.scrollbar = ttk.Scrollbar(view_frame, orient="vertical", command=self.on_scroll)
+        self.scrollbar.pack(side=tk.RIGHT, fill=tk.Y)
+        self.hex_text.pack(fill=tk.BOTH, expand=True, padx=5, pady=5)
+        self.hex_text.bind("<MouseWheel>", self.on_mousewheel)
+        self.hex_text.bind("<Button-4>", lambda e: self.scroll_rows(-3))
+        self.hex_text.bind("<Button-5>", lambda e: self.scroll_rows(3))
+
+        self.render()
+
+    def browse(self, index):
+        """选择待比较的文件"""
+        path = filedialog.askopenfilename(parent=self)
+        if path:
+            self.path_vars[index].set(path)
+
+    def compare(self):
+        """在后台线程中比较两个文件"""
+        paths = [var.get().strip() for var in self.path_vars]
+        if not all(os.path.isfile(p) for p in paths):
+            messagebox.showerror("Error", f"{lang.get('binary-diff.invalid-file')}")
+            return
+
+        self.close_files()
+        try:
+            for i, path in enumerate(paths):
+                self.files[i] = open(path, "rb")
+                self.maps[i] = open_mapping(self.files[i])
+        except OSError as e:
+            self.close_files()
+            messagebox.showerror("Error", str(e))
+            return
+
+        self.ranges = []
+        self.current = -1
+        self.top_row = 0
+        self.nav_var.set(f"{lang.get('binary-diff.comparing')}")
+        self.compare_btn.configure(state="disabled")
+        self.render()
+
+        self.total = min(len(self.maps[0]), len(self.maps[1]))
+        self.start_time = time.perf_counter()
+        self.cancel_event = threading.Event()
+        threading.Thread(
+            target=self.diff_worker,
+            args=(paths, self.cancel_event),
+            daemon=True
+        ).start()
+        self.poll_id = self.after(POLL_INTERVAL, self.poll_results)
+
+    def diff_worker(self, paths, cancel):
+        """工作线程：计算差异区间并把结果放入队列"""
+        try:
+            result = diff_files(*paths, progress=lambda done: self.results.put(("progress", done)), cancel=cancel)
+            self.results.put(("done", result))
+        except Exception as e:
+            # 任何异常都要回报，否则轮询不会停止、比较按钮一直不可用
+            self.results.put(("error", str(e)))
+
+    def poll_results(self):
+        """在 Tk 主线程中处理后台结果"""
+        finished = False
+        try:
+            while True:
+                kind, payload = self.results.get_nowait()
+                if kind == "progress":
+                    if self.status_callback and self.total:
+                        self.status_callback(
+                            f"{lang.get('binary-diff.comparing')} {payload * 100 // self.total}%"
+                        )
+                elif kind == "done":
+                    self.ranges, truncated = payload
+                    self.on_diff_done(truncated)
+                    finished = True
+                else:
+                    self.nav_var.set("")
+                    if self.status_callback:
+                        self.status_callback(f"{lang.get('status-ready')}")
+                    messagebox.showerror("Error", payload)
+                    finished = True
+        except queue.Empty:
+            pass
+
+        if finished:
+            self.poll_id = None
+            self.compare_btn.configure(state="normal")
+        else:
+            self.poll_id = self.after(POLL_INTERVAL, self.poll_results)
+
+    def on_diff_done(self, truncated):
+        """比较完成后跳到第一个差异"""
+        elapsed = time.perf_counter() - self.start_time
+        if self.status_callback:
+            suffix = f" ({lang.get('binary-diff.truncated')})" if truncated else ""
+            self.status_callback(
+                f"{lang.get('binary-diff.found')} {len(self.ranges)}{suffix}, {elapsed:.2f}s"
+            )
+        if self.ranges:
+            self.goto_diff(0)
+        else:
+            self.nav_var.set(f"{lang.get('binary-diff.identical')}")
+            self.render()
+
+    def goto_diff(self, index):
+        """跳转到第 index 个差异区间"""
+        self.current = index
+        start, end = self.ranges[index]
+        self.nav_var.set(f"{index + 1} / {len(self.ranges)}  0x{start:X} (+{end - start})")
+        self.top_row = max(start // BYTES_PER_ROW - 2, 0)
+        self.render()
+
+    def next_diff(self):
+        if self.ranges and self.current < len(self.ranges) - 1:
+            self.goto_diff(self.current + 1)
+
+    def prev_diff(self):
+        if self.ranges and self.current > 0:
+            self.goto_diff(self.current - 1)
+
+    def total_rows(self):
+        size = max(len(self.maps[0]), len(self.maps[1]))
+        return max((size + BYTES_PER_ROW - 1) // BYTES_PER_ROW, 1)
+
+    def on_scroll(self, *args):
+        """滚动条回调：按行号而非文本内容滚动"""
+        if args[0] == "moveto":
+            self.top_row = int(float(args[1]) * self.total_rows())
+            self.render()
+        elif args[0] == "scroll":
+            step = int(args[1]) * (VISIBLE_ROWS if args[2] == "pages" else 1)
+            self.scroll_rows(step)
+
+    def on_mousewheel(self, event):
+        self.scroll_rows(-3 if event.delta > 0 else 3)
+        return "break"
+
+    def scroll_rows(self, step):
+        self.top_row += step
+        self.render()
+        return "break"
+
+    def render(self):
+        """只渲染当前可见的行，两个文件并排显示"""
+        rows = self.total_rows()
+        self.top_row = max(0, min(self.top_row, rows - VISIBLE_ROWS))
+
+        text = self.hex_text
+        text.configure(state="normal")
+        text.delete("1.0", tk.END)
+        text.insert(tk.END, f"{'Offset':<10}{'A':<{BYTES_PER_ROW * 3}} {'B'}\n", "header")
+
+        map_a, map_b = self.maps
+        for row in range(self.top_row, min(self.top_row + VISIBLE_ROWS, rows)):
+            offset = row * BYTES_PER_ROW
+            chunk_a = map_a[offset:offset + BYTES_PER_ROW]
+            chunk_b = map_b[offset:offset + BYTES_PER_ROW]
+            text.insert(tk.END, f"{offset:08X}  ", "header")
+            for chunk, other in ((chunk_a, chunk_b), (chunk_b, chunk_a)):
+                for i in range(BYTES_PER_ROW):
+                    if i < len(chunk):
+                        tag = "diff" if i >= len(other) or chunk[i] != other[i] else ()
+                        text.insert(tk.END, f"{chunk[i]:02X}", tag)
+                        text.insert(tk.END, " ")
+                    else:
+                        text.insert(tk.END, "   ")
+                text.insert(tk.END, " ")
+            text.insert(tk.END, "\n")
+        text.configure(state="disabled")
+
+        first = self.top_row / rows
+        self.scrollbar.set(first, min(first + VISIBLE_ROWS / rows, 1.0))
+
+    def close_files(self):
+        """释放映射和文件句柄"""
+        for m in self.maps:
+            if isinstance(m, mmap.mmap):
+                m.close()
+        for f in self.files:
+            if f is not None:
+                f.close()
+        self.maps = [b"", b""]
+        self.files = [None, None]
+
+    def on_destroy(self, event=None):
+        """离开页面时停止后台比较并释放资源"""
+        if event is None or event.widget is self:
+            if self.poll_id is not None:
+                self.after_cancel(self.poll_id)
+                self.poll_id = None
+            self.cancel_event.set()
+            self.close_files()
+
+    def get_base_path(self):
+        """获取资源文件的基础路径"""
+        try:
+            if getattr(sys, 'frozen', False):
+                base_path = sys._MEIPASS
+            else:
+                base_path = os.path.dirname(os.path.abspath(__file__))
+            return os.path.dirname(base_path)  # 返回到项目根目录
+        except Exception:
+            return os.path.dirname(os.path.abspath(sys.argv[0]))
+
+
+if __name__ == "__main__":
+    root = tk.Tk()
+    app = BinaryDiff(root)
+    root.mainloop()
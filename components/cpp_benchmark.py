@@ -0,0 +1,534 @@
+import tkinter as tk
+from tkinter import ttk
+import os
+import json
+import math
+import queue
+import shutil
+import tempfile
+import threading
+import subprocess
+from lang import lang
+
+# 测试的容器规模
+SIZES = (100, 1000, 10000, 100000, 1000000)
+# 每个规模下至少执行的操作次数，保证小规模时计时足够稳定
+TARGET_OPS = 1 << 21
+# 磁盘缓存位置（每台机器只需测一次）
+CACHE_PATH = os.path.join(os.path.expanduser("~"), ".end_of_universe", "cpp_bench_cache.json")
+# 后台结果轮询间隔（毫秒）
+POLL_INTERVAL = 100
+# 基准代码版本，修改模板后递增以使旧缓存失效
+BENCH_VERSION = 3
+# Windows 下打包为 --windowed，子进程不要弹出控制台窗口
+SUBPROCESS_FLAGS = {"creationflags": subprocess.CREATE_NO_WINDOW} if os.name == "nt" else {}
+
+PRELUDE = r"""
+#include <algorithm>
+#include <array>
+#include <chrono>
+#include <cstdio>
+#include <cstdlib>
+#include <list>
+#include <map>
+#include <set>
+#include <string>
+#include <vector>
+
+using bench_clock = std::chrono::steady_clock;
+static volatile long long sink = 0;
+
+// 0..n-1 的伪随机排列，在计时开始前生成，避免计时循环中的乘法和取模
+static std::vector<long> make_keys(long n) {
+    std::vector<long> keys(n);
+    for (long i = 0; i < n; ++i) {
+        keys[i] = (long)(((unsigned long long)i * 2654435761ULL) % (unsigned long long)n);
+    }
+    return keys;
+}
+
+static inline double elapsed_ns(bench_clock::time_point t0) {
+    return std::chrono::duration<double, std::nano>(bench_clock::now() - t0).count();
+}
+
+int main(int argc, char** argv) {
+    for (int arg = 1; arg < argc; ++arg) {
+        const long n = std::atol(argv[arg]);
+        double total = 0;
+        long ops = 0;
+        const std::vector<long> keys = make_keys(n);
+"""
+
+EPILOGUE = r"""
+        std::printf("%ld %.3f\n", n, total / ops);
+    }
+    return (int)(sink & 0);
+}
+"""
+
+# 各类基准的循环模板：
+#   fill  - 从空容器逐个执行操作直到 n 个元素
+#   drain - 先填满 n 个元素，再逐个执行删除类操作
+#   query - 在 n 个元素的容器上执行随机查询（扣除空循环开销）
+#   bulk  - 对 n 个元素整体执行一次操作，按元素数均摊（ns/元素）
+#   scan  - 对 n 个元素的容器重复执行一次线性操作（ns/次调用）
+TEMPLATES = {
+    "fill": r"""
+        long rounds = std::max(1L, {target}L / n);
+        for (long r = 0; r < rounds; ++r) {{
+            {decl}
+            auto t0 = bench_clock::now();
+            for (long i = 0; i < n; ++i) {{ {op}; }}
+            total += elapsed_ns(t0);
+            sink += c.size();
+        }}
+        ops = rounds * n;
+""",
+    "drain": r"""
+        long rounds = std::max(1L, {target}L / n);
+        for (long r = 0; r < rounds; ++r) {{
+            {decl}
+            for (long i = 0; i < n; ++i) {{ {fill}; }}
+            auto t0 = bench_clock::now();
+            for (long i = 0; i < n; ++i) {{ {op}; }}
+            total += elapsed_ns(t0);
+            sink += c.size();
+        }}
+        ops = rounds * n;
+""",
+    "query": r"""
+        {decl}
+        for (long i = 0; i < n; ++i) {{ {fill}; }}
+        long rounds = std::max(1L, {target}L / n);
+        // 先测空循环（读 key + 写 sink）的开销，再从结果中扣除
+        auto t_base = bench_clock::now();
+        for (long r = 0; r < rounds; ++r) {{
+            for (long i = 0; i < n; ++i) {{ sink += keys[i]; }}
+        }}
+        double base = elapsed_ns(t_base);
+        auto t0 = bench_clock::now();
+        for (long r = 0; r < rounds; ++r) {{
+            for (long i = 0; i < n; ++i) {{ sink += ({op}); }}
+        }}
+        total = std::max(elapsed_ns(t0) - base, 0.0);
+        ops = rounds * n;
+""",
+    "bulk": r"""
+        long rounds = std::max(1L, {target}L / n);
+        for (long r = 0; r < rounds; ++r) {{
+            {decl}
+            for (long i = 0; i < n; ++i) {{ {fill}; }}
+            auto t0 = bench_clock::now();
+            {op};
+            total += elapsed_ns(t0);
+            sink += c.size();
+        }}
+        ops = rounds * n;
+""",
+    "scan": r"""
+        {decl}
+        for (long i = 0; i < n; ++i) {{ {fill}; }}
+        long rounds = std::max(1L, {target}L / n);
+        auto t0 = bench_clock::now();
+        for (long r = 0; r < rounds; ++r) {{ sink += ({op}); }}
+        total = elapsed_ns(t0);
+        ops = rounds;
+""",
+}
+
+VECTOR = "std::vector<int> c;"
+LIST = "std::list<int> c;"
+MAP = "std::map<long, int> c;"
+SET = "std::set<long> c;"
+STRING = "std::string c;"
+# std::array 的大小是编译期常量：按最大规模分配，只使用前 n 个元素
+ARRAY = f"static std::array<int, {SIZES[-1]}> c;"
+
+FILL_INT = "c.push_back((int)i)"
+FILL_CHAR = "c.push_back((char)('a' + i % 26))"
+
+# (数据结构, CPP_DATA 中的函数名) -> 基准定义
+BENCHMARKS = {
+    ("vector", "push_back()"): {"kind": "fill", "decl": VECTOR, "op": "c.push_back((int)i)"},
+    ("vector", "pop_back()"): {"kind": "drain", "decl": VECTOR, "fill": FILL_INT, "op": "sink += c.back(), c.pop_back()"},
+    ("vector", "at(index)"): {"kind": "query", "decl": VECTOR, "fill": FILL_INT, "op": "c.at(keys[i])"},
+    ("vector", "size()"): {"kind": "query", "decl": VECTOR, "fill": FILL_INT, "op": "c.size()"},
+    ("vector", "clear()"): {"kind": "bulk", "decl": VECTOR, "fill": FILL_INT, "op": "c.clear()"},
+    ("vector", "reserve(size)"): {"kind": "bulk", "decl": VECTOR, "fill": FILL_INT, "op": "c.reserve(2 * n)"},
+    ("vector", "resize(size)"): {"kind": "bulk", "decl": VECTOR, "fill": FILL_INT, "op": "c.resize(2 * n)"},
+    ("vector", "empty()"): {"kind": "query", "decl": VECTOR, "fill": FILL_INT, "op": "c.empty()"},
+    ("vector", "front()"): {"kind": "query", "decl": VECTOR, "fill": FILL_INT, "op": "c.front()"},
+    ("vector", "back()"): {"kind": "query", "decl": VECTOR, "fill": FILL_INT, "op": "c.back()"},
+    ("list", "push_front()"): {"kind": "fill", "decl": LIST, "op": "c.push_front((int)i)"},
+    ("list", "push_back()"): {"kind": "fill", "decl": LIST, "op": "c.push_back((int)i)"},
+    ("list", "pop_front()"): {"kind": "drain", "decl": LIST, "fill": FILL_INT, "op": "c.pop_front()"},
+    ("list", "pop_back()"): {"kind": "drain", "decl": LIST, "fill": FILL_INT, "op": "c.pop_back()"},
+    ("list", "insert(iterator, value)"): {"kind": "fill", "decl": LIST, "op": "c.insert(c.end(), (int)i)"},
+    ("list", "erase(iterator)"): {"kind": "drain", "decl": LIST, "fill": FILL_INT, "op": "c.erase(c.begin())"},
+    ("list", "size()"): {"kind": "query", "decl": LIST, "fill": FILL_INT, "op": "c.size()"},
+    ("list", "clear()"): {"kind": "bulk", "decl": LIST, "fill": FILL_INT, "op": "c.clear()"},
+    ("list", "sort()"): {"kind": "bulk", "decl": LIST, "fill": "c.push_back((int)keys[i])", "op": "c.sort()"},
+    # 两个各含 n 个元素的有序链表交错合并
+    ("list", "merge(list)"): {
+        "kind": "bulk", "decl": "std::list<int> c, d;",
+        "fill": "c.push_back((int)(2 * i)), d.push_back((int)(2 * i + 1))", "op": "c.merge(d)",
+    },
+    ("map", "insert({key, value})"): {"kind": "fill", "decl": MAP, "op": "c.insert({keys[i], (int)i})"},
+    ("map", "erase(key)"): {"kind": "drain", "decl": MAP, "fill": "c.insert({i, (int)i})", "op": "c.erase(keys[i])"},
+    ("map", "find(key)"): {"kind": "query", "decl": MAP, "fill": "c.insert({i, (int)i})", "op": "c.find(keys[i]) != c.end()"},
+    ("map", "at(key)"): {"kind": "query", "decl": MAP, "fill": "c.insert({i, (int)i})", "op": "c.at(keys[i])"},
+    ("map", "size()"): {"kind": "query", "decl": MAP, "fill": "c.insert({i, (int)i})", "op": "c.size()"},
+    ("map", "clear()"): {"kind": "bulk", "decl": MAP, "fill": "c.insert({i, (int)i})", "op": "c.clear()"},
+    ("map", "count(key)"): {"kind": "query", "decl": MAP, "fill": "c.insert({i, (int)i})", "op": "c.count(keys[i])"},
+    ("map", "empty()"): {"kind": "query", "decl": MAP, "fill": "c.insert({i, (int)i})", "op": "c.empty()"},
+    ("map", "begin()"): {"kind": "query", "decl": MAP, "fill": "c.insert({i, (int)i})", "op": "c.begin()->second"},
+    ("map", "end()"): {"kind": "query", "decl": MAP, "fill": "c.insert({i, (int)i})", "op": "c.end() != c.begin()"},
+    ("string", "length()"): {"kind": "query", "decl": STRING, "fill": FILL_CHAR, "op": "c.length()"},
+    ("string", "append(str)"): {"kind": "fill", "decl": STRING, "op": "c.append(\"x\")"},
+    ("string", "substr(start, length)"): {"kind": "scan", "decl": STRING, "fill": FILL_CHAR, "op": "c.substr(0, n / 2).size()"},
+    ("string", "find(str)"): {"kind": "scan", "decl": STRING, "fill": FILL_CHAR, "op": "c.find(\"#$\") == std::string::npos"},
+    # 在开头做一次不等长替换（需要搬移后续字符），再换回原长度，保持字符串大小不变
+    ("string", "replace(pos, len, str)"): {
+        "kind": "scan", "decl": STRING, "fill": FILL_CHAR,
+        "op": "c.replace(0, 1, \"xy\").replace(0, 2, \"a\").size()",
+    },
+    ("string", "c_str()"): {"kind": "query", "decl": STRING, "fill": FILL_CHAR, "op": "c.c_str()[keys[i]]"},
+    ("string", "clear()"): {"kind": "bulk", "decl": STRING, "fill": FILL_CHAR, "op": "c.clear()"},
+    ("string", "empty()"): {"kind": "query", "decl": STRING, "fill": FILL_CHAR, "op": "c.empty()"},
+    ("string", "at(index)"): {"kind": "query", "decl": STRING, "fill": FILL_CHAR, "op": "c.at(keys[i])"},
+    # 两个内容相同的字符串，比较需要扫描全部字符
+    ("string", "compare(str)"): {
+        "kind": "scan", "decl": "std::string c, d;",
+        "fill": "c.push_back((char)('a' + i % 26)), d.push_back((char)('a' + i % 26))", "op": "c.compare(d)",
+    },
+    ("array", "at(index)"): {"kind": "query", "decl": ARRAY, "fill": "c[i] = (int)i", "op": "c.at(keys[i])"},
+    ("array", "operator[]"): {"kind": "query", "decl": ARRAY, "fill": "c[i] = (int)i", "op": "c[keys[i]]"},
+    ("array", "front()"): {"kind": "query", "decl": ARRAY, "fill": "c[i] = (int)i", "op": "c.front()"},
+    ("array", "back()"): {"kind": "query", "decl": ARRAY, "fill": "c[i] = (int)i", "op": "c.back()"},
+    ("array", "size()"): {"kind": "query", "decl": ARRAY, "fill": "c[i] = (int)i", "op": "c.size()"},
+    # array::fill 总是填满整个数组，这里只填前 n 个元素以对应规模
+    ("array", "fill(value)"): {"kind": "bulk", "decl": ARRAY, "fill": "c[i] = (int)i", "op": "std::fill_n(c.begin(), n, (int)r)"},
+    ("array", "empty()"): {"kind": "query", "decl": ARRAY, "fill": "c[i] = (int)i", "op": "c.empty()"},
+    ("array", "begin()"): {"kind": "query", "decl": ARRAY, "fill": "c[i] = (int)i", "op": "*c.begin()"},
+    ("array", "end()"): {"kind": "query", "decl": ARRAY, "fill": "c[i] = (int)i", "op": "c.end() - c.begin()"},
+    ("array", "data()"): {"kind": "query", "decl": ARRAY, "fill": "c[i] = (int)i", "op": "c.data()[keys[i]]"},
+    ("set", "insert(value)"): {"kind": "fill", "decl": SET, "op": "c.insert(keys[i])"},
+    ("set", "erase(value)"): {"kind": "drain", "decl": SET, "fill": "c.insert(i)", "op": "c.erase(keys[i])"},
+    ("set", "find(value)"): {"kind": "query", "decl": SET, "fill": "c.insert(i)", "op": "c.find(keys[i]) != c.end()"},
+    ("set", "size()"): {"kind": "query", "decl": SET, "fill": "c.insert(i)", "op": "c.size()"},
+    ("set", "clear()"): {"kind": "bulk", "decl": SET, "fill": "c.insert(i)", "op": "c.clear()"},
+    ("set", "count(value)"): {"kind": "query", "decl": SET, "fill": "c.insert(i)", "op": "c.count(keys[i])"},
+    ("set", "empty()"): {"kind": "query", "decl": SET, "fill": "c.insert(i)", "op": "c.empty()"},
+    ("set", "begin()"): {"kind": "query", "decl": SET, "fill": "c.insert(i)", "op": "*c.begin()"},
+    ("set", "end()"): {"kind": "query", "decl": SET, "fill": "c.insert(i)", "op": "c.end() != c.begin()"},
+}
+
+# 按基准类型区分的单位（其余均为 ns/op）
+UNITS = {"bulk": "ns/elem", "scan": "ns/call"}
+
+_compiler = None
+_compiler_ready = threading.Event()
+_detect_lock = threading.Lock()
+_detect_started = False
+
+
+def detect_compiler():
+    """查找本地 C++ 编译器（会调用子进程，只应在后台线程中运行）"""
+    global _compiler
+    candidates = [os.environ.get("CXX"), "g++", "clang++", "c++"]
+    for name in filter(None, candidates):
+        path = shutil.which(name)
+        if not path:
+            continue
+        try:
+            result = subprocess.run(
+                [path, "--version"],
+                capture_output=True, text=True, timeout=10, **SUBPROCESS_FLAGS
+            )
+        except (OSError, subprocess.SubprocessError):
+            continue
+        if result.returncode == 0 and result.stdout:
+            _compiler = (path, result.stdout.splitlines()[0].strip())
+            break
+    _compiler_ready.set()
+
+
+def start_compiler_detection():
+    """在后台线程中探测编译器，重复调用只会探测一次"""
+    global _detect_started
+    with _detect_lock:
+        if _detect_started:
+            return
+        _detect_started = True
+    threading.Thread(target=detect_compiler, daemon=True).start()
+
+
+def compiler_detected():
+    return _compiler_ready.is_set()
+
+
+def get_compiler():
+    """不阻塞地返回 (路径, 版本)；尚未探测完成或未找到编译器时返回 None"""
+    return _compiler if _compiler_ready.is_set() else None
+
+
+def unit_of(structure, func):
+    return UNITS.get(BENCHMARKS[(structure, func)]["kind"], "ns/op")
+
+
+def build_source(spec):
+    """根据基准定义生成完整的 C++ 源码"""
+    body = TEMPLATES[spec["kind"]].format(
+        target=TARGET_OPS,
+        decl=spec["decl"],
+        fill=spec.get("fill", ""),
+        op=spec["op"],
+    )
+    return PRELUDE + body + EPILOGUE
+
+
+def cache_key(version, structure, func):
+    return f"{version}|v{BENCH_VERSION}|{structure}|{func}"
+
+
+def load_cache():
+    try:
+        with open(CACHE_PATH, "r", encoding="utf-8") as f:
+            return json.load(f)
+    except (OSError, json.JSONDecodeError):
+        return {}
+
+
+def save_cache(cache):
+    os.makedirs(os.path.dirname(CACHE_PATH), exist_ok=True)
+    tmp_path = CACHE_PATH + ".tmp"
+    with open(tmp_path, "w", encoding="utf-8") as f:
+        json.dump(cache, f, ensure_ascii=False, indent=2)
+    os.replace(tmp_path, CACHE_PATH)
+
+
+def get_cached(structure, func, cache=None):
+    """返回缓存的测量结果 {规模: ns}，未缓存或编译器尚未探测完成时返回 None"""
+    compiler = get_compiler()
+    if not compiler:
+        return None
+    if cache is None:
+        cache = load_cache()
+    entry = cache.get(cache_key(compiler[1], structure, func))
+    if not entry or tuple(entry.get("sizes", ())) != SIZES:
+        return None
+    return dict(zip(entry["sizes"], entry["ns"]))
+
+
+def run_benchmark(structure, func):
+    """编译并运行基准，写入缓存后返回 {规模: ns}"""
+    start_compiler_detection()
+    _compiler_ready.wait()
+    compiler = get_compiler()
+    if not compiler:
+        raise RuntimeError(lang.get("cpp-benchmark.no-compiler"))
+    path, version = compiler
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        source = os.path.join(tmp_dir, "bench.cpp")
+        binary = os.path.join(tmp_dir, "bench.exe" if os.name == "nt" else "bench")
+        with open(source, "w", encoding="utf-8") as f:
+            f.write(build_source(BENCHMARKS[(structure, func)]))
+
+        compiled = subprocess.run(
+            [path, "-O2", "-std=c++17", source, "-o", binary],
+            capture_output=True, text=True, timeout=120, **SUBPROCESS_FLAGS
+        )
+        if compiled.returncode != 0:
+            raise RuntimeError(compiled.stderr.strip() or "compile failed")
+
+        measured = subprocess.run(
+            [binary, *map(str, SIZES)],
+            capture_output=True, text=True, timeout=600, **SUBPROCESS_FLAGS
+        )
+        if measured.returncode != 0:
+            raise RuntimeError(measured.stderr.strip() or "benchmark failed")
+
+    results = {}
+    for line in measured.stdout.splitlines():
+        n, ns = line.split()
+        results[int(n)] = float(ns)
+
+    cache = load_cache()
+    cache[cache_key(version, structure, func)] = {
+        "sizes": list(results.keys()),
+        "ns": list(results.values()),
+    }
+    save_cache(cache)
+    return results
+
+
+def format_ns(ns):
+    return f"{ns:.1f}" if ns < 100 else f"{ns:.0f}"
+
+
+def format_cost(structure, func, ns):
+    """带单位后缀的测量值，例如 12.3/op、650/elem"""
+    return f"{format_ns(ns)}/{unit_of(structure, func).split('/')[1]}"
+
+
+class BenchmarkPanel(ttk.LabelFrame):
+    """显示所选容器操作的实测开销曲线，并在后台编译运行基准"""
+
+    def __init__(self, parent, on_result=None, on_compiler_ready=None):
+        super().__init__(parent, text=f"{lang.get('cpp-benchmark.title')}")
+        self.on_result = on_result
+        self.on_compiler_ready = on_compiler_ready
+        self.structure = None
+        self.func = None
+        self.running = False
+        self.results = queue.Queue()
+        self.poll_id = None
+        self.detect_id = None
+        self.bind("<Destroy>", self.on_destroy)
+
+        control_frame = ttk.Frame(self)
+        control_frame.pack(fill=tk.X, padx=5, pady=(5, 0))
+
+        self.run_btn = ttk.Button(
+            control_frame,
+            text=f"{lang.get('cpp-benchmark.run')}",
+            command=self.start_benchmark,
+        )
+        self.run_btn.pack(side=tk.LEFT)
+
+        self.info_var = tk.StringVar()
+        ttk.Label(control_frame, textvariable=self.info_var).pack(side=tk.LEFT, padx=10)
+
+        self.canvas = tk.Canvas(self, height=90, background="white", highlightthickness=0)
+        self.canvas.pack(fill=tk.X, padx=5, pady=5)
+        self.canvas.bind("<Configure>", lambda e: self.redraw())
+
+        # 编译器探测在后台进行，避免阻塞界面
+        start_compiler_detection()
+        if not compiler_detected():
+            self.detect_id = self.after(POLL_INTERVAL, self.wait_for_compiler)
+
+        self.show(None, None)
+
+    def wait_for_compiler(self):
+        """等待后台编译器探测完成后刷新显示"""
+        if not compiler_detected():
+            self.detect_id = self.after(POLL_INTERVAL, self.wait_for_compiler)
+            return
+        self.detect_id = None
+        if self.on_compiler_ready:
+            self.on_compiler_ready()
+        self.show(self.structure, self.func)
+
+    def show(self, structure, func, cache=None):
+        """切换到指定操作，若已缓存则立即显示"""
+        self.structure = structure
+        self.func = func
+        self.data = None
+
+        if not compiler_detected():
+            self.info_var.set(f"{lang.get('cpp-benchmark.detecting')}")
+        elif not get_compiler():
+            self.info_var.set(f"{lang.get('cpp-benchmark.no-compiler')}")
+        elif (structure, func) not in BENCHMARKS:
+            self.info_var.set(f"{lang.get('cpp-benchmark.unavailable')}")
+        else:
+            self.data = get_cached(structure, func, cache)
+            self.info_var.set("" if self.data else f"{lang.get('cpp-benchmark.not-measured')}")
+        self.update_button()
+        self.redraw()
+
+    def update_button(self):
+        enabled = (
+            not self.running
+            and get_compiler() is not None
+            and (self.structure, self.func) in BENCHMARKS
+        )
+        self.run_btn.configure(state="normal" if enabled else "disabled")
+
+    def start_benchmark(self):
+        """在后台线程中编译并运行基准"""
+        self.running = True
+        self.update_button()
+        self.info_var.set(f"{lang.get('cpp-benchmark.running')}")
+        threading.Thread(
+            target=self.benchmark_worker,
+            args=(self.structure, self.func),
+            daemon=True
+        ).start()
+        self.poll_id = self.after(POLL_INTERVAL, self.poll_results)
+
+    def benchmark_worker(self, structure, func):
+        try:
+            self.results.put((structure, func, run_benchmark(structure, func), None))
+        except Exception as e:
+            # 任何异常都要回报，否则 running 一直为 True，按钮无法再次使用
+            self.results.put((structure, func, None, str(e) or type(e).__name__))
+
+    def poll_results(self):
+        try:
+            structure, func, data, error = self.results.get_nowait()
+        except queue.Empty:
+            self.poll_id = self.after(POLL_INTERVAL, self.poll_results)
+            return
+
+        self.poll_id = None
+        self.running = False
+        if error:
+            self.info_var.set(f"{lang.get('cpp-benchmark.failed')}: {error.splitlines()[0]}")
+        else:
+            if self.on_result:
+                self.on_result(structure, func, data)
+            if (structure, func) == (self.structure, self.func):
+                self.data = data
+                self.info_var.set("")
+                self.redraw()
+        self.update_button()
+
+    def on_destroy(self, event=None):
+        """离开页面时取消尚未触发的定时器"""
+        if event is None or event.widget is self:
+            for after_id in (self.poll_id, self.detect_id):
+                if after_id is not None:
+                    self.after_cancel(after_id)
+            self.poll_id = None
+            self.detect_id = None
+
+    def redraw(self):
+        """绘制测量值随规模变化的折线图（对数横轴）"""
+        canvas = self.canvas
+        canvas.delete("all")
+        if not self.data:
+            return
+
+        width = canvas.winfo_width()
+        height = canvas.winfo_height()
+        left, right, top, bottom = 50, 15, 12, 20
+        sizes = sorted(self.data)
+        values = [self.data[n] for n in sizes]
+        max_ns = max(values) * 1.1 or 1.0
+
+        def point(n, ns):
+            span = math.log10(sizes[-1]) - math.log10(sizes[0]) or 1
+            x = left + (math.log10(n) - math.log10(sizes[0])) / span * (width - left - right)
+            y = height - bottom - ns / max_ns * (height - top - bottom)
+            return x, y
+
+        # 坐标轴
+        canvas.create_line(left, top, left, height - bottom, fill="gray")
+        canvas.create_line(left, height - bottom, width - right, height - bottom, fill="gray")
+        canvas.create_text(left - 5, top, text=format_ns(max_ns), anchor="e", font=("Arial", 8))
+        canvas.create_text(left - 5, height - bottom, text="0", anchor="e", font=("Arial", 8))
+        canvas.create_text(
+            left + 5, top,
+            text=unit_of(self.structure, self.func),
+            anchor="w", font=("Arial", 8), fill="gray"
+        )
+
+        points = [point(n, ns) for n, ns in zip(sizes, values)]
+        canvas.create_line(*[c for p in points for c in p], fill="blue", width=2)
+        for (x, y), n, ns in zip(points, sizes, values):
+            canvas.create_oval(x - 3, y - 3, x + 3, y + 3, fill="blue", outline="")
+            canvas.create_text(x, y - 8, text=format_ns(ns), font=("Arial", 8))
+            canvas.create_text(x, height - bottom + 10, text=f"1e{int(math.log10(n))}", font=("Arial", 8))
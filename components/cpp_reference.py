@@ -3,6 +3,7 @@ from tkinter import ttk
 import os
 import sys
 from lang import lang
+from .cpp_benchmark import BenchmarkPanel, SIZES, get_cached, load_cache, format_cost
 
 class CppReference(tk.Frame):
     
@@ -10,6 +11,12 @@ class CppReference(tk.Frame):
         super().__init__(parent)
         self.return_callback = return_callback
         self.pack(fill="both", expand=True)
+        self.cache = {}
+        
+        # 返回按钮（先固定在底部，避免被上方内容挤出固定大小的窗口）
+        if self.return_callback:
+            back_btn = ttk.Button(self, text=f"← {lang.get('back')}", command=self.return_callback)
+            back_btn.pack(side=tk.BOTTOM, pady=(5, 10))
         
         # 主框架
         main_frame = ttk.Frame(self)
@@ -58,12 +65,13 @@ class CppReference(tk.Frame):
         func_frame.pack(fill=tk.BOTH, expand=True)
         
         # 创建树状视图
-        columns = ("function", "description")
+        columns = ("function", "description", "ns")
         self.func_tree = ttk.Treeview(
             func_frame, 
             columns=columns, 
             show="headings",
-            selectmode="browse"
+            selectmode="browse",
+            height=6
         )
 
         # 设置表行间距
@@ -75,18 +83,24 @@ class CppReference(tk.Frame):
         self.func_tree.heading("function", text=f"{lang.get('cpp-reference.functions')}")
         self.func_tree.heading("description", text=f"{lang.get('cpp-reference.description')}")
         self.func_tree.column("function", width=150, minwidth=100)
-        self.func_tree.column("description", width=350, minwidth=200)
+        self.func_tree.heading("ns", text=f"ns (1e{len(str(SIZES[-1])) - 1})")
+        self.func_tree.column("description", width=240, minwidth=180)
+        self.func_tree.column("ns", width=110, minwidth=80, anchor="e")
         
         # 添加滚动条
         scrollbar = ttk.Scrollbar(func_frame, orient="vertical", command=self.func_tree.yview)
         self.func_tree.configure(yscrollcommand=scrollbar.set)
         scrollbar.pack(side=tk.RIGHT, fill=tk.Y)
         self.func_tree.pack(fill=tk.BOTH, expand=True, padx=5, pady=5)
+        self.func_tree.bind("<<TreeviewSelect>>", self.on_function_select)
 
-        # 返回按钮
-        if self.return_callback:
-            back_btn = ttk.Button(self, text=f"← {lang.get('back')}", command=self.return_callback)
-            back_btn.pack(pady=(5, 10))
+        # 基准测试面板：显示所选操作的实测开销
+        self.bench_panel = BenchmarkPanel(
+            right_frame,
+            on_result=self.on_benchmark_result,
+            on_compiler_ready=self.refresh_costs
+        )
+        self.bench_panel.pack(fill=tk.X, pady=(10, 0))
         
         # 初始化显示
         self.on_structure_select()
@@ -116,9 +130,39 @@ class CppReference(tk.Frame):
         
         # 更新函数列表
         self.func_tree.delete(*self.func_tree.get_children())
+        self.func_items = {}
+        self.cache = load_cache()
         
         for func, desc in data.get("functions", {}).items():
-            self.func_tree.insert("", tk.END, values=(func, desc))
+            self.func_items[func] = self.func_tree.insert("", tk.END, values=(func, desc, ""))
+
+        self.refresh_costs()
+        self.bench_panel.show(structure, None, self.cache)
+
+    def refresh_costs(self):
+        """用已加载的缓存填充函数列表中的实测开销"""
+        selection = self.structures_list.curselection()
+        if not selection:
+            return
+        structure = self.structures_list.get(selection[0])
+        for func, item in self.func_items.items():
+            cached = get_cached(structure, func, self.cache)
+            cost = format_cost(structure, func, cached[SIZES[-1]]) if cached else ""
+            self.func_tree.set(item, "ns", cost)
+
+    def on_function_select(self, event=None):
+        """当选择函数时显示其基准测试结果"""
+        selection = self.structures_list.curselection()
+        func_selection = self.func_tree.selection()
+        if not selection or not func_selection:
+            return
+        func = self.func_tree.item(func_selection[0], "values")[0]
+        self.bench_panel.show(self.structures_list.get(selection[0]), func, self.cache)
+
+    def on_benchmark_result(self, structure, func, data):
+        """基准测试完成后重新加载缓存并更新函数列表"""
+        self.cache = load_cache()
+        self.refresh_costs()
 
 
 # C++数据结构参考数据
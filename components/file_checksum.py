@@ -0,0 +1,292 @@
+import tkinter as tk
+from tkinter import ttk, filedialog
+import os
+import sys
+import mmap
+import zlib
+import time
+import queue
+import threading
+import hashlib
+from concurrent.futures import ThreadPoolExecutor
+from lang import lang
+
+# 每次喂给哈希函数的块大小（hashlib 在大块数据上会释放 GIL）
+CHUNK_SIZE = 4 * 1024 * 1024
+# 后台结果轮询间隔（毫秒）
+POLL_INTERVAL = 100
+
+ALGORITHMS = ("CRC32", "MD5", "SHA-1", "SHA-256")
+
+
+def hash_file(path, progress=None, cancel=None):
+    """单次流式读取文件，同时计算 CRC32、MD5、SHA-1 和 SHA-256
+
+    返回 (文件大小, 校验值字典)；cancel 被设置时提前返回 None
+    """
+    crc = 0
+    md5 = hashlib.md5()
+    sha1 = hashlib.sha1()
+    sha256 = hashlib.sha256()
+
+    def feed(chunk):
+        nonlocal crc
+        crc = zlib.crc32(chunk, crc)
+        md5.update(chunk)
+        sha1.update(chunk)
+        sha256.update(chunk)
+        if progress:
+            progress(len(chunk))
+
+    with open(path, "rb") as f:
+        size = os.fstat(f.fileno()).st_size
+        if size > 0:
+            try:
+                mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+            except (OSError, ValueError):
+                # 无法映射（如特殊文件），退回到大块缓冲读取
+                mm = None
+            if mm is not None:
+                with mm, memoryview(mm) as view:
+                    for offset in range(0, size, CHUNK_SIZE):
+                        if cancel and cancel.is_set():
+                            return None
+                        with view[offset:offset + CHUNK_SIZE] as chunk:
+                            feed(chunk)
+            else:
+                for chunk in iter(lambda: f.read(CHUNK_SIZE), b""):
+                    if cancel and cancel.is_set():
+                        return None
+                    feed(chunk)
+
+    return size, {
+        "CRC32": f"{crc & 0xFFFFFFFF:08x}",
+        "MD5": md5.hexdigest(),
+        "SHA-1": sha1.hexdigest(),
+        "SHA-256": sha256.hexdigest(),
+    }
+
+
+class FileChecksum(tk.Frame):
+
+    def __init__(self, parent, return_callback=None, status_callback=None):
+        super().__init__(parent)
+        self.return_callback = return_callback
+        self.status_callback = status_callback
+        self.pack(fill="both", expand=True)
+
+        # 后台线程池与结果队列（工作线程不直接操作 Tk 控件）
+        self.executor = ThreadPoolExecutor(max_workers=min(8, os.cpu_count() or 1))
+        self.results = queue.Queue()
+        self.pending = 0
+        self.bytes_done = 0
+        self.start_time = None
+        self.poll_id = None
+        self.cancel_event = threading.Event()
+        self.bind("<Destroy>", self.on_destroy)
+
+        # 返回按钮（先固定在底部，避免被上方内容挤出固定大小的窗口）
+        if self.return_callback:
+            back_btn = ttk.Button(self, text=f"← {lang.get('back')}", command=self.return_callback)
+            back_btn.pack(side=tk.BOTTOM, pady=(5, 10))
+
+        # 操作按钮
+        action_frame = ttk.Frame(self)
+        action_frame.pack(pady=15, padx=20, fill="x")
+
+        ttk.Button(
+            action_frame,
+            text=f"{lang.get('file-checksum.select-files')}",
+            command=self.select_files,
+        ).pack(side=tk.LEFT, padx=(0, 10))
+
+        ttk.Button(
+            action_frame,
+            text=f"{lang.get('file-checksum.clear')}",
+            command=self.clear_results,
+        ).pack(side=tk.LEFT)
+
+        # 算法选择（结果表中显示哪一列）
+        ttk.Label(action_frame, text=f"{lang.get('file-checksum.algorithm')}").pack(side=tk.LEFT, padx=(20, 5))
+        self.algo_var = tk.StringVar(value="SHA-256")
+        algo_combobox = ttk.Combobox(
+            action_frame,
+            textvariable=self.algo_var,
+            values=ALGORITHMS,
+            width=10,
+            state="readonly"
+        )
+        algo_combobox.pack(side=tk.LEFT)
+        algo_combobox.bind("<<ComboboxSelected>>", self.refresh_digest_column)
+
+        # 结果展示
+        result_frame = ttk.LabelFrame(self, text=f"{lang.get('file-checksum.results')}")
+        result_frame.pack(pady=(0, 10), padx=20, fill="both", expand=True)
+
+        columns = ("file", "size", "digest")
+        self.result_tree = ttk.Treeview(
+            result_frame,
+            columns=columns,
+            show="headings",
+            selectmode="browse",
+            height=6
+        )
+        self.result_tree.heading("file", text=f"{lang.get('file-checksum.file')}")
+        self.result_tree.heading("size", text=f"{lang.get('file-checksum.size')}")
+        self.result_tree.heading("digest", text=self.algo_var.get())
+        self.result_tree.column("file", width=180, minwidth=100)
+        self.result_tree.column("size", width=90, minwidth=60, anchor="e")
+        self.result_tree.column("digest", width=420, minwidth=200)
+
+        scrollbar = ttk.Scrollbar(result_frame, orient="vertical", command=self.result_tree.yview)
+        self.result_tree.configure(yscrollcommand=scrollbar.set)
+        scrollbar.pack(side=tk.RIGHT, fill=tk.Y)
+        self.result_tree.pack(fill=tk.BOTH, expand=True, padx=5, pady=5)
+        self.result_tree.bind("<<TreeviewSelect>>", self.on_result_select)
+
+        # 选中文件的全部校验值（可复制）
+        self.detail_text = tk.Text(self, height=4, font=("Courier", 10), relief="groove")
+        self.detail_text.pack(padx=20, fill="x")
+        self.detail_text.configure(state="disabled")
+
+        # 每个条目的完整结果
+        self.digests = {}
+
+    def select_files(self):
+        """选择文件并提交到线程池并行计算"""
+        paths = filedialog.askopenfilenames(parent=self)
+        if not paths:
+            return
+
+        if self.pending == 0:
+            self.bytes_done = 0
+            self.start_time = time.perf_counter()
+            self.poll_id = self.after(POLL_INTERVAL, self.poll_results)
+
+        for path in paths:
+            item = self.result_tree.insert(
+                "", tk.END,
+                values=(os.path.basename(path), "", f"{lang.get('file-checksum.hashing')}")
+            )
+            self.pending += 1
+            self.executor.submit(self.hash_worker, item, path)
+
+    def hash_worker(self, item, path):
+        """工作线程：计算校验值并把结果放入队列"""
+        try:
+            result = hash_file(
+                path,
+                progress=lambda n: self.results.put(("progress", n)),
+                cancel=self.cancel_event,
+            )
+            if result is not None:
+                self.results.put(("done", item, path, result))
+        except Exception as e:
+            # 任何异常都要回报，否则 pending 永远不会归零
+            self.results.put(("error", item, path, str(e)))
+
+    def poll_results(self):
+        """在 Tk 主线程中处理后台结果并刷新吞吐量"""
+        try:
+            while True:
+                msg = self.results.get_nowait()
+                if msg[0] == "progress":
+                    self.bytes_done += msg[1]
+                    continue
+
+                kind, item, path, payload = msg
+                self.pending -= 1
+                if not self.result_tree.exists(item):
+                    continue
+                if kind == "done":
+                    size, digests = payload
+                    self.digests[item] = digests
+                    self.result_tree.item(item, values=(
+                        os.path.basename(path),
+                        format_size(size),
+                        digests[self.algo_var.get()],
+                    ))
+                else:
+                    self.result_tree.item(item, values=(
+                        os.path.basename(path), "", f"{lang.get('file-checksum.error')}: {payload}"
+                    ))
+        except queue.Empty:
+            pass
+
+        self.update_status()
+        if self.pending > 0:
+            self.poll_id = self.after(POLL_INTERVAL, self.poll_results)
+        else:
+            self.poll_id = None
+
+    def update_status(self):
+        """在状态栏显示吞吐量"""
+        if not self.status_callback or self.start_time is None:
+            return
+        elapsed = max(time.perf_counter() - self.start_time, 1e-6)
+        throughput = self.bytes_done / elapsed / (1024 * 1024)
+        key = "file-checksum.status-hashing" if self.pending > 0 else "file-checksum.status-done"
+        self.status_callback(
+            f"{lang.get(key)} {format_size(self.bytes_done)} @ {throughput:.1f} MB/s"
+        )
+
+    def refresh_digest_column(self, event=None):
+        """切换算法后刷新结果列"""
+        algo = self.algo_var.get()
+        self.result_tree.heading("digest", text=algo)
+        for item, digests in self.digests.items():
+            values = list(self.result_tree.item(item, "values"))
+            values[2] = digests[algo]
+            self.result_tree.item(item, values=values)
+
+    def on_result_select(self, event=None):
+        """显示选中文件的全部校验值"""
+        selection = self.result_tree.selection()
+        digests = self.digests.get(selection[0]) if selection else None
+        self.detail_text.configure(state="normal")
+        self.detail_text.delete("1.0", tk.END)
+        if digests:
+            lines = [f"{algo:<8} {digests[algo]}" for algo in ALGORITHMS]
+            self.detail_text.insert("1.0", "\n".join(lines))
+        self.detail_text.configure(state="disabled")
+
+    def clear_results(self):
+        """清空结果列表"""
+        self.result_tree.delete(*self.result_tree.get_children())
+        self.digests.clear()
+        self.on_result_select()
+
+    def on_destroy(self, event=None):
+        """离开页面时停止轮询，并取消排队中和正在计算的任务"""
+        if event is None or event.widget is self:
+            if self.poll_id is not None:
+                self.after_cancel(self.poll_id)
+                self.poll_id = None
+            self.cancel_event.set()
+            self.executor.shutdown(wait=False, cancel_futures=True)
+
+    def get_base_path(self):
+        """获取资源文件的基础路径"""
+        try:
+            if getattr(sys, 'frozen', False):
+                base_path = sys._MEIPASS
+            else:
+                base_path = os.path.dirname(os.path.abspath(__file__))
+            return os.path.dirname(base_path)  # 返回到项目根目录
+        except Exception:
+            return os.path.dirname(os.path.abspath(sys.argv[0]))
+
+
+def format_size(num_bytes):
+    """把字节数格式化为易读的大小"""
+    size = float(num_bytes)
+    for unit in ("B", "KB", "MB", "GB"):
+        if size < 1024 or unit == "GB":
+            return f"{size:.0f} {unit}" if unit == "B" else f"{size:.1f} {unit}"
+        size /= 1024
+
+
+if __name__ == "__main__":
+    root = tk.Tk()
+    app = FileChecksum(root)
+    root.mainloop()
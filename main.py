@@ -3,7 +3,7 @@ from tkinter import ttk, Menu
 import os
 import sys
 import json
-from components import NumberConverter, CppReference
+from components import NumberConverter, CppReference, FileChecksum, BinaryDiff
 from lang import lang
 
 def get_resource_path(relative_path):
@@ -23,6 +23,7 @@ CONFIG_PATH = get_resource_path('config.json')
 class ToolSelector:
     def __init__(self, root):
         self.root = root
+        self.current_tool = None
         self.load_version()
 
         # 设置应用图标
@@ -58,7 +59,7 @@ class ToolSelector:
         # 状态栏
         self.status_var = tk.StringVar(value=f"{lang.get('status-ready')}")
         status_bar = ttk.Label(
-            root, 
+            self.root, 
             textvariable=self.status_var, 
             relief=tk.SUNKEN, 
             anchor=tk.W
@@ -69,6 +70,7 @@ class ToolSelector:
         # 清除旧 frame
         for widget in self.main_frame.winfo_children():
             widget.destroy()
+        self.current_tool = None
 
         # 标题
         title_label = ttk.Label(self.main_frame, text=f"{lang.get('title')}", style="main-title.TLabel")
@@ -79,21 +81,37 @@ class ToolSelector:
         tool_frame.pack(pady=20, padx=30, fill="both", expand=True)
         
         # 工具按钮
-        hex_button = ttk.Button(
+        self.hex_button = ttk.Button(
             tool_frame, 
             text=f"{lang.get('btn-hex')}", 
             command=self.open_hex_converter,
             width=30
         )
-        hex_button.pack(pady=15, padx=20)
+        self.hex_button.pack(pady=15, padx=20)
         
-        cpp_button = ttk.Button(
+        self.cpp_button = ttk.Button(
             tool_frame, 
             text=f"{lang.get('btn-cpp')}", 
             command=self.open_cpp_reference,
             width=30
         )
-        cpp_button.pack(pady=15, padx=20)
+        self.cpp_button.pack(pady=15, padx=20)
+        
+        self.checksum_button = ttk.Button(
+            tool_frame, 
+            text=f"{lang.get('btn-checksum')}", 
+            command=self.open_file_checksum,
+            width=30
+        )
+        self.checksum_button.pack(pady=15, padx=20)
+        
+        self.diff_button = ttk.Button(
+            tool_frame, 
+            text=f"{lang.get('btn-diff')}", 
+            command=self.open_binary_diff,
+            width=30
+        )
+        self.diff_button.pack(pady=15, padx=20)
         
     def set_icon(self):
         """设置应用图标"""
@@ -128,7 +146,7 @@ class ToolSelector:
         self.status_var.set(f"{lang.get('status-open-hex')}")
         for widget in self.main_frame.winfo_children():
             widget.destroy()
-        NumberConverter(self.main_frame, return_callback=self.build_frame)
+        self.current_tool = NumberConverter(self.main_frame, return_callback=self.build_frame)
         self.status_var.set(f"{lang.get('status-ready')}")
 
     def open_cpp_reference(self):
@@ -136,7 +154,23 @@ class ToolSelector:
         self.status_var.set(f"{lang.get('status-open-cpp')}")
         for widget in self.main_frame.winfo_children():
             widget.destroy()
-        CppReference(self.main_frame, return_callback=self.build_frame)
+        self.current_tool = CppReference(self.main_frame, return_callback=self.build_frame)
+        self.status_var.set(f"{lang.get('status-ready')}")
+
+    def open_file_checksum(self):
+        """打开文件校验工具"""
+        self.status_var.set(f"{lang.get('status-open-checksum')}")
+        for widget in self.main_frame.winfo_children():
+            widget.destroy()
+        self.current_tool = FileChecksum(self.main_frame, return_callback=self.build_frame, status_callback=self.status_var.set)
+        self.status_var.set(f"{lang.get('status-ready')}")
+
+    def open_binary_diff(self):
+        """打开二进制比较工具"""
+        self.status_var.set(f"{lang.get('status-open-diff')}")
+        for widget in self.main_frame.winfo_children():
+            widget.destroy()
+        self.current_tool = BinaryDiff(self.main_frame, return_callback=self.build_frame, status_callback=self.status_var.set)
         self.status_var.set(f"{lang.get('status-ready')}")
 
     def switch_language(self, lang_code):
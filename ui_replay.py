@@ -0,0 +1,216 @@
+import sys
+import json
+import time
+import argparse
+import tkinter as tk
+from pathlib import Path
+
+from main import ToolSelector
+from lang import lang
+
+# Percentiles reported for every action
+PERCENTILES = (50, 95, 99)
+# Keysyms for printable ASCII punctuation (letters and digits are their own keysym)
+KEYSYMS = {
+    " ": "space", "!": "exclam", '"': "quotedbl", "#": "numbersign",
+    "$": "dollar", "%": "percent", "&": "ampersand", "'": "apostrophe",
+    "(": "parenleft", ")": "parenright", "*": "asterisk", "+": "plus",
+    ",": "comma", "-": "minus", ".": "period", "/": "slash",
+    ":": "colon", ";": "semicolon", "<": "less", "=": "equal",
+    ">": "greater", "?": "question", "@": "at", "[": "bracketleft",
+    "\\": "backslash", "]": "bracketright", "^": "asciicircum", "_": "underscore",
+    "`": "grave", "{": "braceleft", "|": "bar", "}": "braceright",
+    "~": "asciitilde",
+}
+
+
+def percentile(samples, pct):
+    """Return the pct-th percentile of samples using linear interpolation."""
+    ordered = sorted(samples)
+    if len(ordered) == 1:
+        return ordered[0]
+    rank = (len(ordered) - 1) * pct / 100
+    low = int(rank)
+    high = min(low + 1, len(ordered) - 1)
+    return ordered[low] + (ordered[high] - ordered[low]) * (rank - low)
+
+
+def keysym_for(ch):
+    """Return the Tk keysym that types the printable ASCII character ch."""
+    if ch.isascii() and ch.isalnum():
+        return ch
+    if ch in KEYSYMS:
+        return KEYSYMS[ch]
+    raise ValueError(f"Cannot type {ch!r}: only printable ASCII is supported")
+
+
+def settle(root):
+    """Process pending events and redraws until the frame is fully painted."""
+    root.update_idletasks()
+    root.update()
+
+
+class UIDriver:
+    """Replays recorded interaction scripts against ToolSelector and times each step."""
+
+    def __init__(self, root, app):
+        self.root = root
+        self.app = app
+
+    def resolve(self, name):
+        """Find a widget or method by attribute name on the current tool, then the app."""
+        for owner in (self.app.current_tool, self.app):
+            if owner is not None and hasattr(owner, name):
+                return getattr(owner, name)
+        raise AttributeError(f"'{name}' not found on current tool or ToolSelector")
+
+    def perform(self, step):
+        """Execute one scripted step (without settling the UI)."""
+        action = step["action"]
+        if action == "click":
+            self.resolve(step["target"]).invoke()
+        elif action == "type":
+            # Deliver real key events so the widget's own bindings run
+            entry = self.resolve(step["target"])
+            entry.delete(0, tk.END)
+            entry.focus_force()
+            self.root.update()
+            text = step["text"]
+            for ch in text:
+                entry.event_generate("<KeyPress>", keysym=keysym_for(ch))
+                self.root.update_idletasks()
+            # Generated key events are dropped when the window does not hold the
+            # input focus; fail loudly instead of letting later steps hit a modal dialog
+            typed = entry.get()
+            if typed != text:
+                raise RuntimeError(
+                    f"typing into '{step['target']}' produced {typed!r} instead of {text!r}; "
+                    "make sure the replay window has keyboard focus"
+                )
+        elif action == "select":
+            listbox = self.resolve(step["target"])
+            listbox.selection_clear(0, tk.END)
+            listbox.selection_set(step["index"])
+            listbox.see(step["index"])
+            listbox.event_generate("<<ListboxSelect>>")
+        elif action == "scroll":
+            self.resolve(step["target"]).yview_scroll(step.get("amount", 1), "units")
+        elif action == "call":
+            self.resolve(step["target"])(*step.get("args", []))
+        elif action == "back":
+            self.app.current_tool.return_callback()
+        elif action == "switch_language":
+            self.app.switch_language(step["lang"])
+        else:
+            raise ValueError(f"Unknown action: {action}")
+
+    def run(self, steps):
+        """Run a script once, returning [(label, seconds), ...] for each step."""
+        timings = []
+        for i, step in enumerate(steps):
+            label = step.get("label") or f"{i:02d}:{step['action']}:{step.get('target', step.get('lang', ''))}"
+            start = time.perf_counter()
+            self.perform(step)
+            settle(self.root)
+            timings.append((label, time.perf_counter() - start))
+        return timings
+
+
+def replay(script, repeat):
+    """Replay a script several times and collect latency samples per action label."""
+    root = tk.Tk()
+    initial_lang = lang.lang_code
+    samples = {}
+    try:
+        app = ToolSelector(root)
+        settle(root)
+        driver = UIDriver(root, app)
+        for _ in range(repeat):
+            for label, elapsed in driver.run(script["steps"]):
+                samples.setdefault(label, []).append(elapsed)
+            # Return to the home screen so every round starts from the same state
+            if lang.lang_code != initial_lang:
+                app.switch_language(initial_lang)
+            elif app.current_tool is not None:
+                app.build_frame()
+            settle(root)
+    finally:
+        root.destroy()
+    return samples
+
+
+def summarize(samples):
+    """Reduce raw samples to percentiles in milliseconds."""
+    return {
+        label: {f"p{p}": percentile(values, p) * 1000 for p in PERCENTILES} | {"n": len(values)}
+        for label, values in samples.items()
+    }
+
+
+def find_regressions(current, baseline, threshold):
+    """Return actions whose p95 grew by more than threshold percent versus baseline."""
+    regressions = []
+    for label, stats in current.items():
+        if label not in baseline:
+            continue
+        before = baseline[label]["p95"]
+        after = stats["p95"]
+        if before > 0 and (after - before) / before * 100 > threshold:
+            regressions.append((label, before, after))
+    return regressions
+
+
+def print_report(summary, baseline=None):
+    """Print a latency table, including the baseline p95 when available."""
+    header = f"{'Action':<40}{'n':>5}{'p50 ms':>10}{'p95 ms':>10}{'p99 ms':>10}"
+    if baseline:
+        header += f"{'base p95':>10}"
+    print(header)
+    print("-" * len(header))
+    for label, stats in summary.items():
+        line = f"{label:<40}{stats['n']:>5}{stats['p50']:>10.2f}{stats['p95']:>10.2f}{stats['p99']:>10.2f}"
+        if baseline and label in baseline:
+            line += f"{baseline[label]['p95']:>10.2f}"
+        print(line)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Replay recorded UI scripts and report latency percentiles.")
+    parser.add_argument("script", type=Path, help="Interaction script (JSON)")
+    parser.add_argument("-n", "--repeat", type=int, default=20, help="Number of replays (default: 20)")
+    parser.add_argument("-o", "--output", type=Path, help="Save the summary to this JSON file")
+    parser.add_argument("-b", "--baseline", type=Path, help="Compare against a previously saved summary")
+    parser.add_argument("-t", "--threshold", type=float, default=10.0,
+                        help="p95 regression threshold in percent (default: 10)")
+    args = parser.parse_args()
+
+    with open(args.script, "r", encoding="utf-8") as f:
+        script = json.load(f)
+
+    summary = summarize(replay(script, args.repeat))
+
+    baseline = None
+    if args.baseline:
+        with open(args.baseline, "r", encoding="utf-8") as f:
+            baseline = json.load(f)
+
+    print_report(summary, baseline)
+
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            json.dump(summary, f, ensure_ascii=False, indent=2)
+        print(f"\n✅ Summary saved to: {args.output}")
+
+    if baseline:
+        regressions = find_regressions(summary, baseline, args.threshold)
+        if regressions:
+            print(f"\n❌ {len(regressions)} regression(s) above {args.threshold:.0f}%:")
+            for label, before, after in regressions:
+                print(f"  {label}: p95 {before:.2f} ms -> {after:.2f} ms")
+            return 1
+        print("\n✅ No regressions")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())